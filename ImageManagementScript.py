@@ -6,21 +6,31 @@
 # In[ ]:
 
 
+import os
 import re
+import json
 import shutil
+import tempfile
 import logging
+import logging.handlers
+from functools import lru_cache
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List
-import textwrap
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Set, Tuple
+import string
 
-import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from tqdm import tqdm
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: falls back to a substring scan per filename
+    ahocorasick = None
+
 # ---------------------------------
-# Requirements: pandas, openpyxl, tqdm
+# Requirements: openpyxl, tqdm (optional: pyahocorasick)
 # ---------------------------------
 
 # ---------------------------------
@@ -29,14 +39,22 @@ from tqdm import tqdm
 EXCEL_FILE = Path("Images tracker.xlsx")  # Default Excel file path
 SOURCE_DIR = Path("Movies")                # Base directory for source images
 DOWNLOAD_BASE_DIR = Path.home() / "Downloads"  # Default downloads folder
+COPY_BUFFER_SIZE = 1024 * 1024                 # Buffer size for copies without an OS fast path
+IMAGE_TYPES = ("Poster", "Still")             # Image folder types searched per distributor
+
+# shutil uses this buffer whenever no sendfile/fcopyfile fast path applies (default 64 KiB off Windows)
+shutil.COPY_BUFSIZE = COPY_BUFFER_SIZE
 
 # ---------------------------------
 # Logger Setup
 # ---------------------------------
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+# Buffer records and write them in batches; warnings and errors flush immediately
+log_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.WARNING, target=_stream_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler()]
+    handlers=[log_handler]
 )
 logger = logging.getLogger(__name__)
 
@@ -44,9 +62,88 @@ logger = logging.getLogger(__name__)
 # ---------------------------------
 # Utility Functions
 # ---------------------------------
+_CLEAN_RE = re.compile(r'\W+')
+
+
+@lru_cache(maxsize=None)
 def clean_string(s: str) -> str:
-    """Remove non-alphanumeric characters and lowercase the string."""
-    return re.sub(r'\W+', '', s).lower() if s else ''
+    """Remove non-alphanumeric characters and lowercase the string (cached)."""
+    return _CLEAN_RE.sub('', s).lower() if s else ''
+
+
+def match_titles_in_folders(
+    cleaned_titles: Set[str],
+    indexes: List[List[Tuple[str, str]]]
+) -> List[Dict[str, List[str]]]:
+    """
+    For each folder index, map every cleaned title to the paths whose cleaned name contains it.
+
+    Uses one Aho-Corasick automaton for all titles when pyahocorasick is installed,
+    otherwise tests each title against each filename.
+    """
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for cleaned_title in cleaned_titles:
+            automaton.add_word(cleaned_title, cleaned_title)
+        automaton.make_automaton()
+
+    results = []
+    for index in indexes:
+        hits: Dict[str, List[str]] = {cleaned_title: [] for cleaned_title in cleaned_titles}
+        for cleaned_name, path in index:
+            if automaton is not None:
+                found = {title for _, title in automaton.iter(cleaned_name)}
+            else:
+                found = [title for title in cleaned_titles if title in cleaned_name]
+            for cleaned_title in found:
+                hits[cleaned_title].append(path)
+        results.append(hits)
+    return results
+
+
+def iter_sheet_rows(workbook: Workbook, sheet_name: str, columns: Iterable[str]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Stream the given header columns of a workbook sheet.
+
+    Yields one tuple per non-empty data row, in the order the columns were requested.
+    """
+    rows = workbook[sheet_name].iter_rows(values_only=True)
+    header = next(rows, ())
+    indexes = [header.index(column) for column in columns]
+    for row in rows:
+        if all(value is None for value in row):
+            continue
+        yield tuple(row[i] if i < len(row) else None for i in indexes)
+
+
+def load_contacts(workbook: Workbook) -> Dict[str, Tuple[Any, Any]]:
+    """Map each distributor to its first (contact name, email) in the 'Distributor_contact' sheet."""
+    contacts: Dict[str, Tuple[Any, Any]] = {}
+    rows = iter_sheet_rows(workbook, 'Distributor_contact', ('Distributor', 'Contact Name(s)', 'Email(s)'))
+    for distributor, contact_name, email in rows:
+        if distributor:
+            contacts.setdefault(distributor, (contact_name, email))
+    return contacts
+
+
+def copy_file(src_path: Path, dest_path: Path) -> None:
+    """Copy file contents only, using copy_file_range where the OS supports it."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src_path, "rb") as fsrc, open(dest_path, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break  # Some FUSE/network filesystems copy nothing, fall back below
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass  # e.g. cross-device or unsupported filesystem, fall back below
+
+    shutil.copyfile(src_path, dest_path)
 
 
 # ---------------------------------
@@ -55,59 +152,200 @@ def clean_string(s: str) -> str:
 class ImageManager:
     """Manage image search and copy operations."""
 
-    def __init__(self, source_dir: Path, download_dir: Path):
-        """Initialize with source and download directories."""
+    def __init__(self, source_dir: Path, download_dir: Path, name_cache_path: Optional[Path] = None):
+        """Initialize with source and download directories and an optional cleaned-filename cache file."""
         self.source_dir = source_dir
         self.download_dir = download_dir
         self.copy_errors: List[str] = []
+        self._target_folders: Dict[Tuple[str, str], Optional[Path]] = {}
+        self._index: Dict[Path, List[Tuple[str, str]]] = {}
+        self._matches: Dict[Path, Dict[str, List[str]]] = {}
+        self._name_cache_path = name_cache_path
+        self._name_cache = self._load_name_cache()
+        self._names_seen: Dict[str, Dict[str, str]] = {}
+
+    def _load_name_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load the folder -> {filename: cleaned filename} cache saved by previous runs."""
+        if self._name_cache_path is None:
+            return {}
+        try:
+            with open(self._name_cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {folder: names for folder, names in cache.items() if isinstance(names, dict)}
+
+    def save_name_cache(self) -> None:
+        """
+        Write the cleaned names of the folders walked in this run into the cache file.
 
-    def find_image(self, movie_title: str, distributor: str, folder_type: str) -> Optional[Path]:
-        """Find an image matching movie title in distributor folder."""
+        Each walked folder's entry is replaced, so renamed or deleted files drop out;
+        folders not walked in this run keep their previous entry unless they no longer exist.
+        """
+        if self._name_cache_path is None:
+            return
+        changed = {folder: names for folder, names in self._names_seen.items() if self._name_cache.get(folder) != names}
+        removed = [folder for folder in self._name_cache if not (self.source_dir / folder).is_dir()]
+        if not changed and not removed:
+            return
+        self._name_cache.update(changed)
+        for folder in removed:
+            del self._name_cache[folder]
+        try:
+            with open(self._name_cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._name_cache, f)
+        except OSError as e:
+            logger.warning(f"Could not write filename cache {self._name_cache_path}: {e}")
+
+    def _get_target_folder(self, distributor: str, folder_type: str) -> Optional[Path]:
+        """Resolve (once) the folder searched by find_image for a distributor."""
+        key = (distributor, folder_type)
+        if key in self._target_folders:
+            return self._target_folders[key]
+
+        target_folder = None
         distributor_folder = self.source_dir / distributor
         if not distributor_folder.exists():
             logger.warning(f"Distributor folder not found: {distributor_folder}")
-            return None
-
-        poster_folders = [f for f in distributor_folder.iterdir() if 'Poster' in f.name and f.is_dir()]
-        if len(poster_folders) == 1 and 'Horizontal Posters' in poster_folders[0].name:
-            target_folder = poster_folders[0]
         else:
-            target_folder = distributor_folder / folder_type
+            with os.scandir(distributor_folder) as entries:
+                poster_folders = [e for e in entries if 'Poster' in e.name and e.is_dir()]
+            if len(poster_folders) == 1 and 'Horizontal Posters' in poster_folders[0].name:
+                target_folder = Path(poster_folders[0].path)
+            else:
+                target_folder = distributor_folder / folder_type
 
-        if not target_folder.exists():
-            logger.warning(f"Target folder does not exist: {target_folder}")
-            return None
+            if not target_folder.exists():
+                logger.warning(f"Target folder does not exist: {target_folder}")
+                target_folder = None
 
-        matching_files = []
-        for file in target_folder.rglob("*"):
-            if file.is_file() and clean_string(movie_title) in clean_string(file.name):
-                matching_files.append(file)
+        self._target_folders[key] = target_folder
+        return target_folder
 
-        for priority_tag in ["(1)", "(2)"]:
-            for f in matching_files:
-                if priority_tag in f.name:
-                    return f
+    def _get_folders(self, pairs: Iterable[Tuple[str, str]]) -> Set[Path]:
+        """Existing folders searched by find_image/find_image_by_title_only for the pairs."""
+        folders = set()
+        for distributor, folder_type in pairs:
+            folders.add(self._get_target_folder(distributor, folder_type))
+            folders.add(self.source_dir / distributor / folder_type)
+        return {folder for folder in folders if folder is not None and folder.exists()}
 
-        if matching_files:
-            return matching_files[0]
+    def _build_index(self, folder: Path) -> List[Tuple[str, str]]:
+        """
+        Walk a folder with os.scandir and collect (cleaned filename, path) for every file.
+
+        Paths are kept as strings; Path objects are only built for matching files.
+        Directories are visited depth-first in listing order, like os.walk.
+        """
+        folder_key = folder.relative_to(self.source_dir).as_posix()
+        cached_names = self._name_cache.get(folder_key, {})
+        names: Dict[str, str] = {}
+        index = []
+        stack = [os.fspath(folder)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            cleaned_name = cached_names.get(entry.name)
+                            if not isinstance(cleaned_name, str):
+                                cleaned_name = clean_string(entry.name)
+                            names[entry.name] = cleaned_name
+                            index.append((cleaned_name, entry.path))
+            except OSError as e:
+                logger.warning(f"Could not read folder {e.filename}: {e}")
+                continue
+            stack.extend(reversed(subdirs))
+        self._names_seen[folder_key] = names
+        return index
+
+    def _get_index(self, folder: Path) -> List[Tuple[str, str]]:
+        """Return the cached index of a folder, walking it on first use."""
+        index = self._index.get(folder)
+        if index is None:
+            index = self._index[folder] = self._build_index(folder)
+        return index
+
+    def prewarm(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Build the indexes for the (distributor, folder_type) pairs in parallel."""
+        folders = [folder for folder in self._get_folders(pairs) if folder not in self._index]
+        if not folders:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(32, len(folders))) as pool:
+            for folder, index in zip(folders, pool.map(self._build_index, folders)):
+                self._index[folder] = index
+
+    def match_titles(self, titles_by_distributor: Dict[str, Set[str]], folder_types: Iterable[str]) -> None:
+        """
+        Batch-match each distributor's titles against that distributor's folders.
 
-        return None
+        Every folder index is scanned once for all titles of its distributor, and
+        find_image then only picks from the stored matches. Replaces any previous matches.
+        """
+        self._matches = {}
+        folder_types = tuple(folder_types)
+
+        for distributor, titles in titles_by_distributor.items():
+            cleaned_titles = {clean_string(title) for title in titles} - {''}
+            folders = list(self._get_folders((distributor, folder_type) for folder_type in folder_types))
+            if not cleaned_titles or not folders:
+                continue
+            hits = match_titles_in_folders(cleaned_titles, [self._get_index(folder) for folder in folders])
+            self._matches.update(zip(folders, hits))
+
+    def _iter_candidates(self, folder: Path, cleaned_title: str) -> Iterator[Path]:
+        """Yield files in folder whose cleaned name contains the cleaned title."""
+        matches = self._matches.get(folder)
+        if matches is not None and cleaned_title in matches:
+            for path in matches.get(cleaned_title, []):
+                yield Path(path)
+            return
+        for cleaned_name, path in self._get_index(folder):
+            if cleaned_title in cleaned_name:
+                yield Path(path)
 
-    def find_image_by_title_only(self, title: str, distributor: str, folder_type: str) -> Optional[Path]:
-        """Find image by title only without season/episode."""
-        dist_folder = self.source_dir / distributor
-        if not dist_folder.exists():
+    def find_image(self, movie_title: str, distributor: str, folder_type: str) -> Optional[Path]:
+        """Find an image matching movie title in distributor folder, preferring "(1)" then "(2)"."""
+        target_folder = self._get_target_folder(distributor, folder_type)
+        if target_folder is None:
             return None
 
-        target_folder = dist_folder / folder_type
+        match_2 = match_any = None
+        for path in self._iter_candidates(target_folder, clean_string(movie_title)):
+            if "(1)" in path.name:
+                return path
+            if match_2 is None and "(2)" in path.name:
+                match_2 = path
+            if match_any is None:
+                match_any = path
+
+        return match_2 or match_any
+
+    def find_image_by_title_only(self, title: str, distributor: str, folder_type: str) -> Optional[Path]:
+        """Find image by title only without season/episode."""
+        target_folder = self.source_dir / distributor / folder_type
         if not target_folder.exists():
             return None
 
-        for file in target_folder.rglob("*"):
-            if file.is_file() and clean_string(title) in clean_string(file.name):
-                return file
+        return next(self._iter_candidates(target_folder, clean_string(title)), None)
 
-        return None
+    def resolve_images(self, movie_title: str, distributor: str) -> Tuple[Optional[Path], Optional[Path]]:
+        """Find the (poster, still) paths for a movie, falling back to a title-only search."""
+        poster_path = self.find_image(movie_title, distributor, "Poster")
+        if not poster_path:
+            poster_path = self.find_image_by_title_only(movie_title, distributor, "Poster")
+
+        still_path = self.find_image(movie_title, distributor, "Still")
+        if not still_path:
+            still_path = self.find_image_by_title_only(movie_title, distributor, "Still")
+
+        return poster_path, still_path
 
     def copy_image(self, src_path: Path, distributor: str, folder_type: str) -> Optional[str]:
         """Copy image to download directory, create folders if needed."""
@@ -115,8 +353,9 @@ class ImageManager:
             dest_folder = self.download_dir / distributor / folder_type
             dest_folder.mkdir(parents=True, exist_ok=True)
             dest_path = dest_folder / src_path.name
-            shutil.copy(src_path, dest_path)
-            logger.info(f"Copied image: {src_path} -> {dest_path}")
+            copy_file(src_path, dest_path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Copied image: {src_path} -> {dest_path}")
             return src_path.name
         except PermissionError as e:
             logger.error(f"Permission denied copying {src_path}: {e}")
@@ -131,108 +370,297 @@ class ImageManager:
 # ---------------------------------
 # ExcelHandler Class
 # ---------------------------------
+class _TitleIndex:
+    """
+    Cleaned title -> row number map of the 'Movies' sheet, cached in a JSON sidecar.
+
+    The sidecar is only reused while the workbook's exact size and mtime match the
+    ones recorded with it.
+    """
+
+    def __init__(self, excel_path: Path):
+        """Set the workbook path and its sidecar path."""
+        self.excel_path = excel_path
+        self.cache_path = excel_path.with_suffix('.titleidx.json')
+
+    def _workbook_signature(self) -> List[int]:
+        """(size, mtime in ns) of the workbook file as stored on disk."""
+        stat = self.excel_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def load(self, sheet) -> Dict[str, int]:
+        """Return the cached map if still valid, otherwise build it from the sheet."""
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("workbook") == self._workbook_signature():
+                return cached["titles"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass  # Missing, unreadable or old-format cache, rebuild below
+
+        return self.build(sheet)
+
+    def build(self, sheet) -> Dict[str, int]:
+        """Build the map from column B of the sheet (cached by save once the workbook is saved)."""
+        title_map: Dict[str, int] = {}
+        title_cells = sheet.iter_rows(min_row=2, min_col=2, max_col=2, values_only=True)  # Column B
+        for row_idx, (title,) in enumerate(title_cells, start=2):
+            if title:
+                title_map[clean_string(str(title))] = row_idx
+        return title_map
+
+    def save(self, title_map: Dict[str, int]) -> None:
+        """Write the map to the sidecar file along with the workbook's current signature."""
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"workbook": self._workbook_signature(), "titles": title_map}, f)
+        except OSError as e:
+            logger.warning(f"Could not write title index {self.cache_path}: {e}")
+
+
 class ExcelHandler:
     """
     Handle Excel workbook operations for updating image data.
     """
 
-    def __init__(self, excel_path: Path):
-        """Load workbook and select the 'Movies' sheet."""
+    def __init__(self, workbook: Workbook, excel_path: Path):
+        """Use an already loaded workbook, saved back to excel_path, and select the 'Movies' sheet."""
         self.excel_path = excel_path
-        self.workbook = load_workbook(excel_path)
+        self.workbook = workbook
         self.sheet = self.workbook['Movies']
+        self.title_index = _TitleIndex(excel_path)
 
-    def update_images(self, movie_data: Dict[str, Dict[str, Optional[str]]]) -> None:
-        """
-        Update the Excel sheet with poster and still image filenames.
+    def _match_rows(
+        self,
+        movie_data: Dict[str, Dict[str, Optional[str]]],
+        title_map: Dict[str, int]
+    ) -> Optional[List[Tuple[int, Dict[str, Optional[str]]]]]:
         """
-        sheet_title_map = {}
-        for row in self.sheet.iter_rows(min_row=2, max_row=self.sheet.max_row):
-            cell = row[1]  # Column B (index 1)
-            title = cell.value
-            if title:
-                cleaned = clean_string(str(title))
-                sheet_title_map[cleaned] = cell
+        Pair each movie found in title_map with its row number.
 
+        Returns None if a mapped row no longer holds that title, i.e. the map is stale.
+        """
+        rows = []
+        max_row = self.sheet.max_row  # Computed by scanning every cell, so read it once
         for movie_title, images in movie_data.items():
             cleaned_title = clean_string(movie_title)
-            if cleaned_title in sheet_title_map:
-                cell = sheet_title_map[cleaned_title]
-                if images.get("Poster"):
-                    cell.offset(0, 2).value = images["Poster"]  # Column D
-                if images.get("Still"):
-                    cell.offset(0, 3).value = images["Still"]  # Column E
+            row_idx = title_map.get(cleaned_title)
+            if row_idx is None:
+                continue
+            title = self.sheet.cell(row=row_idx, column=2).value if row_idx <= max_row else None
+            if not title or clean_string(str(title)) != cleaned_title:
+                return None
+            rows.append((row_idx, images))
+        return rows
+
+    def update_images(self, movie_data: Dict[str, Dict[str, Optional[str]]]) -> None:
+        """
+        Update the Excel sheet with poster and still image filenames.
+        """
+        sheet_title_map = self.title_index.load(self.sheet)
+        rows = self._match_rows(movie_data, sheet_title_map)
+        if rows is None:
+            logger.info("Title index is out of date, rebuilding it from the sheet.")
+            sheet_title_map = self.title_index.build(self.sheet)
+            rows = self._match_rows(movie_data, sheet_title_map)
+
+        for row_idx, images in rows:
+            if images.get("Poster"):
+                self.sheet.cell(row=row_idx, column=4, value=images["Poster"])  # Column D
+            if images.get("Still"):
+                self.sheet.cell(row=row_idx, column=5, value=images["Still"])  # Column E
 
         self.workbook.save(self.excel_path)
+        # Only columns D/E changed, so record the saved workbook's signature with the same map
+        self.title_index.save(sheet_title_map)
         logger.info("Excel file updated with image filenames.")
 
 
+def stream_update_images(excel_path: Path, movie_data: Dict[str, Dict[str, Optional[str]]]) -> None:
+    """
+    Update image filenames by streaming the workbook values-only, without a full load.
+
+    Rows are read in read-only mode, columns D/E of matching 'Movies' rows are patched,
+    and everything is written through a write-only workbook to a temp file that then
+    replaces the original. Uses a small fraction of ExcelHandler's memory on large
+    trackers and is somewhat faster (most with lxml installed), but formulas lose their cached values until Excel recalculates, and styles, merged
+    cells, column widths, data validation, defined names, charts and pivots are dropped.
+    Every row holding a matching title is filled, not only the last one.
+    """
+    images_by_title = {clean_string(title): images for title, images in movie_data.items()}
+
+    source = load_workbook(excel_path, read_only=True)
+    target = Workbook(write_only=True)
+    try:
+        for sheet in source.worksheets:
+            target_sheet = target.create_sheet(sheet.title)
+            rows = sheet.iter_rows(values_only=True)
+            if sheet.title != 'Movies':
+                for row in rows:
+                    target_sheet.append(row)
+                continue
+
+            target_sheet.append(next(rows, ()))  # Header row
+            for row in rows:
+                title = row[1] if len(row) > 1 else None  # Column B
+                images = images_by_title.get(clean_string(str(title))) if title else None
+                if images and (images.get("Poster") or images.get("Still")):
+                    row = list(row) + [None] * (5 - len(row))
+                    if images.get("Poster"):
+                        row[3] = images["Poster"]  # Column D
+                    if images.get("Still"):
+                        row[4] = images["Still"]  # Column E
+                target_sheet.append(row)
+    finally:
+        source.close()
+
+    fd, tmp_name = tempfile.mkstemp(suffix=excel_path.suffix, dir=excel_path.parent)
+    os.close(fd)
+    try:
+        target.save(tmp_name)
+        shutil.copymode(excel_path, tmp_name)  # mkstemp creates the file as 0600
+        os.replace(tmp_name, excel_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    logger.info("Excel file updated with image filenames (values-only fast write).")
+
+
 # ---------------------------------
 # Main Process Function
 # ---------------------------------
 def process_images(
     excel_file: Path,
     source_dir: Path,
-    download_base_dir: Path
+    download_base_dir: Path,
+    fast_write: bool = False
 ) -> None:
     """
     Process images: search, copy, update Excel and generate report.
+
+    fast_write streams the Excel update values-only (see stream_update_images): far less
+    memory on large trackers, but formatting and other workbook features are dropped.
     """
+    try:
+        _process_images(excel_file, source_dir, download_base_dir, fast_write)
+    finally:
+        # Also show buffered records when the run fails (e.g. in a notebook kernel)
+        log_handler.flush()
+
+
+def _process_images(
+    excel_file: Path,
+    source_dir: Path,
+    download_base_dir: Path,
+    fast_write: bool
+) -> None:
+    """Body of process_images, run with the log buffer flushed afterwards."""
     today_str = datetime.now().strftime("%d%b")
     download_dir = download_base_dir / f"Images sourced {today_str}"
     download_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Download directory set to: {download_dir}")
 
-    distributor_contact_df = pd.read_excel(excel_file, sheet_name='Distributor_contact')
-    df_movies = pd.read_excel(excel_file, sheet_name='Movies')
+    # Inputs come from a read-only, data_only load so formula cells give their cached
+    # values; the full load below is only used by ExcelHandler for the write
+    read_workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        distributor_contacts = load_contacts(read_workbook)
+
+        # Normalize both columns once; empty cells become ''
+        movie_rows: List[Tuple[str, str]] = [
+            ('' if title is None else str(title).strip(), '' if distributor is None else str(distributor).strip())
+            for title, distributor in iter_sheet_rows(read_workbook, 'Movies', ('Title', 'Distributor'))
+        ]
+    finally:
+        read_workbook.close()
 
-    img_manager = ImageManager(source_dir, download_dir)
-    excel_handler = ExcelHandler(excel_file)
+    # The cleaned-name cache lives next to the tracker, not in the shared image library
+    img_manager = ImageManager(source_dir, download_dir, excel_file.with_suffix('.names.json'))
+    excel_handler = None if fast_write else ExcelHandler(load_workbook(excel_file), excel_file)
 
     movie_data: Dict[str, Dict[str, Optional[str]]] = {}
     not_found: Dict[str, List[str]] = defaultdict(list)
 
     logger.info("Starting image search...")
 
-    for _, row in tqdm(df_movies.iterrows(), total=len(df_movies), desc="Processing movies"):
-        title = row['Title']
-        distributor = row['Distributor']
-
-        title_str = str(title).strip() if pd.notna(title) else None
-        distributor_str = str(distributor).strip() if pd.notna(distributor) else None
-
+    searches: List[Tuple[str, str]] = []
+    titles_by_distributor: Dict[str, Set[str]] = defaultdict(set)
+    pending: List[Tuple[str, str, Optional[List[Optional[Future]]]]] = []
+    for title_str, distributor_str in movie_rows:
         if not title_str or not distributor_str:
-            not_found[distributor_str or "UNDEFINED DISTRIBUTOR"].append(title_str or "Undefined title")
+            pending.append((title_str or "Undefined title", distributor_str or "UNDEFINED DISTRIBUTOR", None))
             continue
 
-        poster_path = img_manager.find_image(title_str, distributor_str, "Poster")
-        if not poster_path:
-            poster_path = img_manager.find_image_by_title_only(title_str, distributor_str, "Poster")
-
-        still_path = img_manager.find_image(title_str, distributor_str, "Still")
-        if not still_path:
-            still_path = img_manager.find_image_by_title_only(title_str, distributor_str, "Still")
+        searches.append((title_str, distributor_str))
+        titles_by_distributor[distributor_str].add(title_str)
+        pending.append((title_str, distributor_str, []))
+
+    img_manager.prewarm((distributor, folder_type) for distributor in titles_by_distributor for folder_type in IMAGE_TYPES)
+    img_manager.match_titles(titles_by_distributor, IMAGE_TYPES)
+    img_manager.save_name_cache()
+
+    copy_futures: Dict[Path, Future] = {}
+    search_futures = (futures for _, _, futures in pending if futures is not None)
+    resolved = (img_manager.resolve_images(title, distributor) for title, distributor in searches)
+    resolved = tqdm(resolved, total=len(searches), desc="Processing movies")
+
+    with ThreadPoolExecutor(max_workers=8) as copy_pool:
+        for (_, distributor_str), image_paths, futures in zip(searches, resolved, search_futures):
+            # Copies run in the background; each destination file is only written once
+            for folder_type, src_path in zip(IMAGE_TYPES, image_paths):
+                if not src_path:
+                    futures.append(None)
+                    continue
+                dest_path = download_dir / distributor_str / folder_type / src_path.name
+                if dest_path not in copy_futures:
+                    copy_futures[dest_path] = copy_pool.submit(
+                        img_manager.copy_image, src_path, distributor_str, folder_type
+                    )
+                futures.append(copy_futures[dest_path])
+
+    for title_str, distributor_str, futures in pending:
+        if futures is None:
+            not_found[distributor_str].append(title_str)
+            continue
 
-        poster_name = img_manager.copy_image(poster_path, distributor_str, "Poster") if poster_path else None
-        still_name = img_manager.copy_image(still_path, distributor_str, "Still") if still_path else None
+        poster_name, still_name = (future.result() if future else None for future in futures)
 
         movie_data[title_str] = {"Poster": poster_name, "Still": still_name}
 
         if not poster_name and not still_name:
             not_found[distributor_str].append(title_str)
 
-    excel_handler.update_images(movie_data)
-    generate_report(not_found, download_dir, distributor_contact_df, img_manager.copy_errors)
+    if excel_handler is None:
+        stream_update_images(excel_file, movie_data)
+    else:
+        excel_handler.update_images(movie_data)
+    generate_report(not_found, download_dir, distributor_contacts, img_manager.copy_errors)
 
 
 # ---------------------------------
 # Report Generator
 # ---------------------------------
+_EMAIL_TEMPLATE = string.Template(
+    "Hi $contact,\n"
+    "\n"
+    "I hope this message finds you well.\n"
+    "Could you please assist with the poster and still images for the titles listed below?\n"
+    "\n"
+    "$titles\n"
+    "\n"
+    "These assets will be featured onboard the Condor 0225 update.\n"
+    "\n"
+    "Thank you in advance.\n"
+    "\n"
+    "Best regards,\n"
+)
+
+
 def generate_report(
     not_found: Dict[str, List[str]],
     download_dir: Path,
-    distributor_contact_df: pd.DataFrame,
+    distributor_contacts: Dict[str, Tuple[Any, Any]],
     copy_errors: List[str]
 ) -> None:
     """
@@ -240,54 +668,41 @@ def generate_report(
     """
     total_missing = sum(len(titles) for titles in not_found.values())
 
-    lines: List[str] = []
-    if total_missing > 0:
-        logger.warning(f"Images not found for {total_missing} titles.")
-        lines.append(f"Images were not found for {total_missing} titles:\n")
-
-        for distributor, titles in not_found.items():
-            lines.append(f"DISTRIBUTOR {distributor.upper()}:")
-            for title in titles:
-                lines.append(f" - {title}")
-
-            contact_info = distributor_contact_df[distributor_contact_df['Distributor'] == distributor]
-            if not contact_info.empty:
-                contact_name = contact_info.iloc[0]['Contact Name(s)']
-                email = contact_info.iloc[0]['Email(s)']
-
-                message = textwrap.dedent(f"""                    Hi {contact_name},
-
-                    I hope this message finds you well.
-                    Could you please assist with the poster and still images for the titles listed below?
-
-                    {"".join(f"- {t}\n" for t in titles)}
-
-                    These assets will be featured onboard the Condor 0225 update.
-
-                    Thank you in advance.
-
-                    Best regards,
-                """)
-
-                lines.append(f"\nEmail draft for {distributor}:")
-                lines.append(f"To: {email}")
-                lines.append("Message:")
-                lines.append(message)
-            else:
-                lines.append(f"No contact information found for {distributor}")
-    else:
-        logger.info("All images were successfully found.")
-        lines.append("All images were successfully found.")
-
-    if copy_errors:
-        logger.error(f"Errors copying {len(copy_errors)} files:")
-        lines.append("\nErrors copying these files:")
-        for err_file in copy_errors:
-            lines.append(f"- {err_file}")
-
     report_path = download_dir / "image_search_report.txt"
     with open(report_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        if total_missing > 0:
+            logger.warning(f"Images not found for {total_missing} titles.")
+            print(f"Images were not found for {total_missing} titles:\n", file=f)
+
+            for distributor, titles in not_found.items():
+                print(f"DISTRIBUTOR {distributor.upper()}:", file=f)
+                for title in titles:
+                    print(f" - {title}", file=f)
+
+                contact_info = distributor_contacts.get(distributor)
+                if contact_info is not None:
+                    contact_name, email = contact_info
+
+                    message = _EMAIL_TEMPLATE.substitute(
+                        contact=contact_name,
+                        titles="\n".join(f"- {t}" for t in titles)
+                    )
+
+                    print(f"\nEmail draft for {distributor}:", file=f)
+                    print(f"To: {email}", file=f)
+                    print("Message:", file=f)
+                    print(message, file=f)
+                else:
+                    print(f"No contact information found for {distributor}", file=f)
+        else:
+            logger.info("All images were successfully found.")
+            print("All images were successfully found.", file=f)
+
+        if copy_errors:
+            logger.error(f"Errors copying {len(copy_errors)} files:")
+            print("\nErrors copying these files:", file=f)
+            for err_file in copy_errors:
+                print(f"- {err_file}", file=f)
 
     logger.info(f"Process completed. Report saved to {report_path}")
 